@@ -1,10 +1,37 @@
 import argparse
+import functools
+import re
 from binascii import Error
 
-from eth_account import Account
 from eth_typing import ChecksumAddress
+from eth_utils import keccak
 from hexbytes import HexBytes
-from web3 import Web3
+
+_ETHEREUM_ADDRESS_RE = re.compile(r"\A0x[0-9a-fA-F]{40}\Z")
+
+
+@functools.lru_cache(maxsize=2048)
+def _address_digest(address_lower: bytes) -> bytes:
+    return keccak(address_lower)
+
+
+def _is_checksum_address(address: str) -> bool:
+    """
+    EIP-55 checksum verification. The Keccak-256 digest is cached keyed on the
+    lowercased address, so every capitalization of the same address shares one
+    hash per session
+
+    :param address: ``0x`` prefixed address of 40 hex chars
+    :return: ``True`` if the address matches its EIP-55 checksummed form
+    """
+    body = address[2:]
+    digest = _address_digest(body.lower().encode())
+    for i, character in enumerate(body):
+        if character.isalpha():
+            nibble = (digest[i // 2] >> (4 * (1 - i % 2))) & 0xF
+            if (nibble > 7) != character.isupper():
+                return False
+    return True
 
 
 def check_positive_integer(number: str) -> int:
@@ -22,14 +49,32 @@ def check_positive_integer(number: str) -> int:
     return number
 
 
+@functools.lru_cache(maxsize=1024)
 def check_ethereum_address(address: str) -> ChecksumAddress:
     """
-    Ethereum address validator for Argparse
+    Ethereum address validator for Argparse. Results for valid addresses are
+    cached, as the same Safe/owner/token addresses are validated over and over
+    in an interactive session (failures are not cached and re-raise each call)
 
     :param address:
     :return: Checksummed ethereum address
     """
-    if not Web3.is_checksum_address(address):
+    # Cheap format check first, so obvious non-addresses don't pay for the
+    # Keccak-256 hashing done by the checksum verification
+    if not _ETHEREUM_ADDRESS_RE.match(address):
+        raise argparse.ArgumentTypeError(
+            f"{address} is not a valid checksummed ethereum address"
+        )
+    body = address[2:]
+    if body.islower() or body.isupper():
+        # Addresses pasted from explorers are often all one case; tell the
+        # user the checksum is missing instead of hashing just to say "not
+        # valid"
+        raise argparse.ArgumentTypeError(
+            f"{address} has no EIP-55 checksum. Use the mixed-case checksummed "
+            f"version of the address"
+        )
+    if not _is_checksum_address(address):
         raise argparse.ArgumentTypeError(
             f"{address} is not a valid checksummed ethereum address"
         )
@@ -43,6 +88,9 @@ def check_private_key(private_key: str) -> str:
     :param private_key: Ethereum Private key
     :return: Ethereum Private key
     """
+    # Imported here to keep the module import light for `--help`
+    from eth_account import Account
+
     try:
         Account.from_key(private_key)
     except (ValueError, Error):  # TODO Report `Error` exception as a bug of eth_account
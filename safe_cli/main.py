@@ -2,7 +2,7 @@
 import argparse
 import os
 import sys
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 from art import text2art
 from eth_typing import ChecksumAddress
@@ -12,18 +12,15 @@ from prompt_toolkit.history import FileHistory
 from prompt_toolkit.lexers import PygmentsLexer
 
 from safe_cli.argparse_validators import check_ethereum_address
-from safe_cli.operators import (
-    SafeOperator,
-    SafeServiceNotAvailable,
-    SafeTxServiceOperator,
-)
 from safe_cli.prompt_parser import PromptParser
 from safe_cli.safe_completer import SafeCompleter
 from safe_cli.safe_lexer import SafeLexer
-from safe_cli.utils import get_safe_from_owner
 
 from .version import version
 
+if TYPE_CHECKING:
+    from safe_cli.operators import SafeOperator
+
 
 class SafeCli:
     def __init__(self, safe_address: ChecksumAddress, node_url: str, history: bool):
@@ -32,6 +29,9 @@ class SafeCli:
         :param node_url: Ethereum RPC url
         :param history: If `True` keep command history, otherwise history is not kept after closing the CLI
         """
+        # Imported here so `safe-cli --help` doesn't pay the web3 import cost
+        from safe_cli.operators import SafeOperator
+
         self.safe_address = safe_address
         self.node_url = node_url
         if history:
@@ -52,6 +52,8 @@ class SafeCli:
         self.safe_operator.print_info()
 
     def get_prompt_text(self):
+        from safe_cli.operators import SafeTxServiceOperator
+
         mode: Optional[str] = "blockchain"
         if isinstance(self.prompt_parser.safe_operator, SafeTxServiceOperator):
             mode = "tx-service"
@@ -66,12 +68,14 @@ class SafeCli:
             f"{self.safe_operator.safe_cli_info}</style></b>"
         )
 
-    def parse_operator_mode(self, command: str) -> Optional[SafeOperator]:
+    def parse_operator_mode(self, command: str) -> Optional["SafeOperator"]:
         """
         Parse operator mode to switch between blockchain (default) and tx-service
         :param command:
         :return: SafeOperator if detected
         """
+        from safe_cli.operators import SafeServiceNotAvailable, SafeTxServiceOperator
+
         split_command = command.split()
         try:
             if (split_command[0]) == "tx-service":
@@ -142,6 +146,8 @@ def build_safe_cli() -> Optional[SafeCli]:
 
     args = parser.parse_args()
     if args.get_safes_from_owner:
+        from safe_cli.utils import get_safe_from_owner
+
         if (
             safe_address := get_safe_from_owner(args.address, args.node_url)
         ) is not None:
@@ -1,500 +1,714 @@
 import argparse
 import functools
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
+from weakref import WeakKeyDictionary, proxy
 
 from prompt_toolkit import HTML, print_formatted_text
 
-from gnosis.safe.api import SafeAPIException
-
 from .argparse_validators import (
     check_ethereum_address,
     check_hex_str,
     check_keccak256_hash,
 )
-from .operators import SafeServiceNotAvailable
-from .operators.exceptions import (
-    AccountNotLoadedException,
-    ExistingOwnerException,
-    FallbackHandlerNotSupportedException,
-    HardwareWalletException,
-    HashAlreadyApproved,
-    InvalidMasterCopyException,
-    InvalidMigrationContractException,
-    InvalidNonceException,
-    NonExistingOwnerException,
-    NotEnoughEtherToSend,
-    NotEnoughSignatures,
-    NotEnoughTokenToSend,
-    SafeAlreadyUpdatedException,
-    SafeOperatorException,
-    SafeVersionNotSupportedException,
-    SameFallbackHandlerException,
-    SameMasterCopyException,
-    SenderRequiredException,
-    ThresholdLimitException,
+
+if TYPE_CHECKING:
+    from .operators.safe_operator import SafeOperator
+
+
+# Static error messages, parsed by `HTML` once at import instead of on every
+# exception
+_SENDER_REQUIRED_MESSAGE = HTML("<ansired>Please load a default sender</ansired>")
+_THRESHOLD_LIMIT_MESSAGE = HTML(
+    "<ansired>Having less owners than threshold is not allowed</ansired>"
 )
-from .operators.safe_operator import SafeOperator
+_FALLBACK_HANDLER_NOT_SUPPORTED_MESSAGE = HTML(
+    "<ansired>Fallback handler is not supported for your Safe, "
+    "you need to <b>update</b> first</ansired>"
+)
+_SAFE_ALREADY_UPDATED_MESSAGE = HTML("<ansired>Safe is already updated</ansired>")
 
 
-def safe_exception(function):
-    @functools.wraps(function)
-    def wrapper(*args, **kwargs):
-        try:
-            return function(*args, **kwargs)
-        except SafeAPIException as e:
-            if e.args:
-                print_formatted_text(HTML(f"<b><ansired>{e.args[0]}</ansired></b>"))
-        except AccountNotLoadedException as e:
-            print_formatted_text(
-                HTML(f"<ansired>Account {e.args[0]} is not loaded</ansired>")
-            )
-        except NotEnoughSignatures as e:
-            print_formatted_text(
-                HTML(
-                    f"<ansired>Cannot find enough owners to sign. {e.args[0]} missing</ansired>"
-                )
-            )
-        except SenderRequiredException:
-            print_formatted_text(
-                HTML("<ansired>Please load a default sender</ansired>")
-            )
-        except ExistingOwnerException as e:
-            print_formatted_text(
-                HTML(
-                    f"<ansired>Owner {e.args[0]} is already an owner of the Safe"
-                    f"</ansired>"
-                )
-            )
-        except NonExistingOwnerException as e:
-            print_formatted_text(
-                HTML(
-                    f"<ansired>Owner {e.args[0]} is not an owner of the Safe"
-                    f"</ansired>"
-                )
-            )
-        except HashAlreadyApproved as e:
-            print_formatted_text(
-                HTML(
-                    f"<ansired>Transaction with safe-tx-hash {e.args[0].hex()} has already been approved by "
-                    f"owner {e.args[1]}</ansired>"
-                )
-            )
-        except ThresholdLimitException:
-            print_formatted_text(
-                HTML(
-                    "<ansired>Having less owners than threshold is not allowed"
-                    "</ansired>"
-                )
-            )
-        except SameFallbackHandlerException as e:
-            print_formatted_text(
-                HTML(
-                    f"<ansired>Fallback handler {e.args[0]} is the current one</ansired>"
-                )
-            )
-        except FallbackHandlerNotSupportedException:
-            print_formatted_text(
-                HTML(
-                    "<ansired>Fallback handler is not supported for your Safe, "
-                    "you need to <b>update</b> first</ansired>"
-                )
-            )
-        except SameMasterCopyException as e:
-            print_formatted_text(
-                HTML(f"<ansired>Master Copy {e.args[0]} is the current one</ansired>")
-            )
-        except InvalidMasterCopyException as e:
-            print_formatted_text(
-                HTML(f"<ansired>Master Copy {e.args[0]} is not valid</ansired>")
-            )
-        except InvalidMigrationContractException as e:
-            print_formatted_text(HTML(f"<ansired>{e.args[0]}</ansired>"))
-        except InvalidNonceException as e:
-            print_formatted_text(HTML(f"<ansired>{e.args[0]}</ansired>"))
-        except SafeAlreadyUpdatedException:
-            print_formatted_text(HTML("<ansired>Safe is already updated</ansired>"))
-        except SafeVersionNotSupportedException as e:
-            print_formatted_text(HTML(f"<ansired>{e.args[0]}</ansired>"))
-        except (NotEnoughEtherToSend, NotEnoughTokenToSend) as e:
-            print_formatted_text(
-                HTML(
-                    f"<ansired>Cannot find enough to send. Current balance is {e.args[0]}"
-                    f"</ansired>"
-                )
-            )
-        except SafeServiceNotAvailable as e:
-            print_formatted_text(
-                HTML(
-                    f"<ansired>Service not available for network {e.args[0]}</ansired>"
-                )
-            )
-        except HardwareWalletException as e:
-            print_formatted_text(
-                HTML(f"<ansired>HwDevice exception: {e.args[0]}</ansired>")
-            )
-        except SafeOperatorException as e:
-            print_formatted_text(HTML(f"<ansired>{e.args[0]}</ansired>"))
+class _LazyParserMap(dict):
+    """
+    ``name -> parser`` mapping for :class:`_LazySubParsersAction` that builds
+    parsers on demand, so only the subcommand being parsed pays the
+    ``add_parser``/``add_argument`` cost
+    """
 
-    return wrapper
+    def __init__(self, action: "_LazySubParsersAction"):
+        super().__init__()
+        self._action = action
 
+    def __contains__(self, name) -> bool:
+        return dict.__contains__(self, name) or name in self._action._builders
 
-class PromptParser:
-    def __init__(self, safe_operator: SafeOperator):
-        self.mode_parser = argparse.ArgumentParser(prog="")
-        self.safe_operator = safe_operator
-        self.prompt_parser = build_prompt_parser(safe_operator)
+    def __iter__(self) -> Iterator[str]:
+        # Registration order, so the choices in usage/help output don't
+        # depend on which parsers have been materialized already
+        yield from self._action._ordered_names
 
-    def process_command(self, command: str):
-        args = self.prompt_parser.parse_args(command.split())
-        return args.func(args)
+    def __missing__(self, name: str) -> argparse.ArgumentParser:
+        builder = self._action._builders.pop(name)
+        builder(self._action)
+        return dict.__getitem__(self, name)
 
 
-def build_prompt_parser(safe_operator: SafeOperator) -> argparse.ArgumentParser:
+class _LazySubParsersAction(argparse._SubParsersAction):
     """
-    Returns an ArgParse capable of decoding and executing the Safe commands
-    :param safe_operator:
-    :return:
+    ``_SubParsersAction`` replacement that defers parser construction.
+    ``add_lazy_parser`` just stores a builder callable; the builder is only
+    invoked when its subcommand is actually parsed
     """
-    prompt_parser = argparse.ArgumentParser(prog="")
-    subparsers = prompt_parser.add_subparsers()
 
-    @safe_exception
-    def show_cli_owners(args):
-        safe_operator.show_cli_owners()
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._builders: Dict[str, Callable[["_LazySubParsersAction"], None]] = {}
+        # Subcommand names in registration order (dict used as an ordered set)
+        self._ordered_names: Dict[str, None] = {}
+        self._name_parser_map = _LazyParserMap(self)
+        self.choices = self._name_parser_map
+
+    def add_parser(self, name: str, **kwargs) -> argparse.ArgumentParser:
+        self._ordered_names[name] = None
+        return super().add_parser(name, **kwargs)
+
+    def add_lazy_parser(
+        self, name: str, builder: Callable[["_LazySubParsersAction"], None]
+    ) -> None:
+        self._ordered_names[name] = None
+        self._builders[name] = builder
+
+
+# Shared `add_argument` kwargs: the same specs repeat across many commands, so
+# reuse one dict object instead of building a new literal per entry
+_ADDRESS_KWARGS = {"type": check_ethereum_address}
+_ADDRESSES_KWARGS = {"type": check_ethereum_address, "nargs": "+"}
+_INT_KWARGS = {"type": int}
+_STR_KWARGS = {"type": str}
+_STRS_KWARGS = {"type": str, "nargs": "+"}
+_HEX_KWARGS = {"type": check_hex_str}
+_HEXES_KWARGS = {"type": check_hex_str, "nargs": "+"}
+_OPTIONAL_THRESHOLD_KWARGS = {"type": int, "default": None}
+_SAFE_NONCE_ARGUMENT = (
+    ("--safe-nonce",),
+    {
+        "type": int,
+        "help": "Use custom safe nonce instead of "
+        "the one for last executed SafeTx + 1",
+    },
+)
 
-    @safe_exception
-    def load_cli_owners_from_words(args):
-        safe_operator.load_cli_owners_from_words(args.words)
 
-    @safe_exception
-    def load_cli_owners(args):
-        safe_operator.load_cli_owners(args.keys)
+class Command(NamedTuple):
+    """
+    Declarative description of a prompt subcommand: the subparser to build
+    and how to map the parsed arguments to a ``SafeOperator`` method call
+    """
 
-    @safe_exception
-    def load_ledger_cli_owners(args):
-        safe_operator.load_ledger_cli_owners(
-            derivation_path=args.derivation_path, legacy_account=args.legacy_accounts
-        )
+    name: str  # Subcommand name
+    method: str  # `SafeOperator` method to call
+    # `(args, kwargs)` tuples passed to `add_argument`
+    arguments: Tuple[Tuple[Tuple[str, ...], Dict[str, Any]], ...] = ()
+    # Namespace attributes passed positionally to the method
+    positional: Tuple[str, ...] = ()
+    # `(method keyword, Namespace attribute)` pairs passed as keywords
+    keyword: Tuple[Tuple[str, str], ...] = ()
 
-    @safe_exception
-    def unload_cli_owners(args):
-        safe_operator.unload_cli_owners(args.addresses)
-
-    @safe_exception
-    def approve_hash(args):
-        safe_operator.approve_hash(args.hash_to_approve, args.sender)
-
-    @safe_exception
-    def add_owner(args):
-        safe_operator.add_owner(args.address, threshold=args.threshold)
-
-    @safe_exception
-    def remove_owner(args):
-        safe_operator.remove_owner(args.address, threshold=args.threshold)
-
-    @safe_exception
-    def change_fallback_handler(args):
-        safe_operator.change_fallback_handler(args.address)
-
-    @safe_exception
-    def change_guard(args):
-        safe_operator.change_guard(args.address)
-
-    @safe_exception
-    def change_master_copy(args):
-        safe_operator.change_master_copy(args.address)
-
-    @safe_exception
-    def change_threshold(args):
-        safe_operator.change_threshold(args.threshold)
-
-    @safe_exception
-    def send_custom(args):
-        safe_operator.send_custom(
-            args.to,
-            args.value,
-            args.data,
-            safe_nonce=args.safe_nonce,
-            delegate_call=args.delegate,
-        )
 
-    @safe_exception
-    def send_ether(args):
-        safe_operator.send_ether(args.to, args.value, safe_nonce=args.safe_nonce)
+_COMMANDS: Tuple[Command, ...] = (
+    # Cli owners
+    Command("show_cli_owners", "show_cli_owners"),
+    Command(
+        "load_cli_owners_from_words",
+        "load_cli_owners_from_words",
+        arguments=((("words",), _STRS_KWARGS),),
+        positional=("words",),
+    ),
+    Command(
+        "load_cli_owners",
+        "load_cli_owners",
+        arguments=((("keys",), _STRS_KWARGS),),
+        positional=("keys",),
+    ),
+    Command(
+        "load_ledger_cli_owners",
+        "load_ledger_cli_owners",
+        arguments=(
+            (
+                ("--derivation-path",),
+                {"type": str, "help": "Load address for the provided derivation path"},
+            ),
+            (
+                ("--legacy-accounts",),
+                {"action": "store_true", "help": "Enable search legacy accounts"},
+            ),
+        ),
+        keyword=(
+            ("derivation_path", "derivation_path"),
+            ("legacy_account", "legacy_accounts"),
+        ),
+    ),
+    Command(
+        "unload_cli_owners",
+        "unload_cli_owners",
+        arguments=((("addresses",), _ADDRESSES_KWARGS),),
+        positional=("addresses",),
+    ),
+    # Change threshold
+    Command(
+        "change_threshold",
+        "change_threshold",
+        arguments=((("threshold",), _INT_KWARGS),),
+        positional=("threshold",),
+    ),
+    # Approve hash
+    Command(
+        "approve_hash",
+        "approve_hash",
+        arguments=(
+            (("hash_to_approve",), {"type": check_keccak256_hash}),
+            (("sender",), _ADDRESS_KWARGS),
+        ),
+        positional=("hash_to_approve", "sender"),
+    ),
+    # Add and remove owners
+    Command(
+        "add_owner",
+        "add_owner",
+        arguments=(
+            (("address",), _ADDRESS_KWARGS),
+            (("--threshold",), _OPTIONAL_THRESHOLD_KWARGS),
+        ),
+        positional=("address",),
+        keyword=(("threshold", "threshold"),),
+    ),
+    Command(
+        "remove_owner",
+        "remove_owner",
+        arguments=(
+            (("address",), _ADDRESS_KWARGS),
+            (("--threshold",), _OPTIONAL_THRESHOLD_KWARGS),
+        ),
+        positional=("address",),
+        keyword=(("threshold", "threshold"),),
+    ),
+    # Change FallbackHandler, Guard and MasterCopy
+    Command(
+        "change_fallback_handler",
+        "change_fallback_handler",
+        arguments=((("address",), _ADDRESS_KWARGS),),
+        positional=("address",),
+    ),
+    Command(
+        "change_guard",
+        "change_guard",
+        arguments=((("address",), _ADDRESS_KWARGS),),
+        positional=("address",),
+    ),
+    Command(
+        "change_master_copy",
+        "change_master_copy",
+        arguments=((("address",), _ADDRESS_KWARGS),),
+        positional=("address",),
+    ),
+    # Update Safe to last version
+    Command("update", "update_version"),
+    # Update non L2 Safe to L2 Safe
+    Command(
+        "update_version_to_l2",
+        "update_version_to_l2",
+        arguments=((("migration_contract",), _ADDRESS_KWARGS),),
+        positional=("migration_contract",),
+    ),
+    # Drain only needs receiver account
+    Command(
+        "drain",
+        "drain",
+        arguments=((("to",), _ADDRESS_KWARGS),),
+        positional=("to",),
+    ),
+    # Retrieve threshold, nonce or owners
+    Command("get_threshold", "get_threshold"),
+    Command("get_nonce", "get_nonce"),
+    Command("get_owners", "get_owners"),
+    # Enable and disable modules
+    Command(
+        "enable_module",
+        "enable_module",
+        arguments=((("address",), _ADDRESS_KWARGS),),
+        positional=("address",),
+    ),
+    Command(
+        "disable_module",
+        "disable_module",
+        arguments=((("address",), _ADDRESS_KWARGS),),
+        positional=("address",),
+    ),
+    # Info and refresh
+    Command("info", "print_info"),
+    Command("refresh", "refresh_safe_cli_info"),
+    # Delegates
+    Command("get_delegates", "get_delegates"),
+    Command(
+        "add_delegate",
+        "add_delegate",
+        arguments=(
+            (("address",), _ADDRESS_KWARGS),
+            (("label",), _STR_KWARGS),
+            (("signer",), _ADDRESS_KWARGS),
+        ),
+        positional=("address", "label", "signer"),
+    ),
+    Command(
+        "remove_delegate",
+        "remove_delegate",
+        arguments=(
+            (("address",), _ADDRESS_KWARGS),
+            (("signer",), _ADDRESS_KWARGS),
+        ),
+        positional=("address", "signer"),
+    ),
+    # Send custom/ether/erc20/erc721
+    Command(
+        "send_custom",
+        "send_custom",
+        arguments=(
+            (("to",), _ADDRESS_KWARGS),
+            (("value",), _INT_KWARGS),
+            (("data",), _HEX_KWARGS),
+            _SAFE_NONCE_ARGUMENT,
+            (
+                ("--delegate",),
+                {
+                    "action": "store_true",
+                    "help": "Use DELEGATE_CALL. By default use CALL",
+                },
+            ),
+        ),
+        positional=("to", "value", "data"),
+        keyword=(("safe_nonce", "safe_nonce"), ("delegate_call", "delegate")),
+    ),
+    Command(
+        "send_ether",
+        "send_ether",
+        arguments=(
+            (("to",), _ADDRESS_KWARGS),
+            (("value",), _INT_KWARGS),
+            _SAFE_NONCE_ARGUMENT,
+        ),
+        positional=("to", "value"),
+        keyword=(("safe_nonce", "safe_nonce"),),
+    ),
+    Command(
+        "send_erc20",
+        "send_erc20",
+        arguments=(
+            (("to",), _ADDRESS_KWARGS),
+            (("token_address",), _ADDRESS_KWARGS),
+            (("amount",), _INT_KWARGS),
+            _SAFE_NONCE_ARGUMENT,
+        ),
+        positional=("to", "token_address", "amount"),
+        keyword=(("safe_nonce", "safe_nonce"),),
+    ),
+    Command(
+        "send_erc721",
+        "send_erc721",
+        arguments=(
+            (("to",), _ADDRESS_KWARGS),
+            (("token_address",), _ADDRESS_KWARGS),
+            (("token_id",), _INT_KWARGS),
+            _SAFE_NONCE_ARGUMENT,
+        ),
+        positional=("to", "token_address", "token_id"),
+        keyword=(("safe_nonce", "safe_nonce"),),
+    ),
+    # Tx-Service
+    Command("balances", "get_balances"),
+    Command("history", "get_transaction_history"),
+    Command(
+        "sign-tx",
+        "submit_signatures",
+        arguments=((("safe_tx_hash",), _HEX_KWARGS),),
+        positional=("safe_tx_hash",),
+    ),
+    Command(
+        "batch-txs",
+        "batch_txs",
+        arguments=(
+            (("safe_nonce",), _INT_KWARGS),
+            (("safe_tx_hashes",), _HEXES_KWARGS),
+        ),
+        positional=("safe_nonce", "safe_tx_hashes"),
+    ),
+    Command(
+        "execute-tx",
+        "execute_tx",
+        arguments=((("safe_tx_hash",), _HEX_KWARGS),),
+        positional=("safe_tx_hash",),
+    ),
+)
 
-    @safe_exception
-    def send_erc20(args):
-        safe_operator.send_erc20(
-            args.to, args.token_address, args.amount, safe_nonce=args.safe_nonce
-        )
 
-    @safe_exception
-    def send_erc721(args):
-        safe_operator.send_erc721(
-            args.to, args.token_address, args.token_id, safe_nonce=args.safe_nonce
+def _build_simple_commands() -> (
+    Dict[str, Tuple[str, Tuple[Callable, ...], Optional[Callable]]]
+):
+    """
+    :return: Commands from `_COMMANDS` that can be dispatched without argparse,
+        mapped to their `SafeOperator` method name, the converters for their
+        fixed positional arguments and, if the last argument takes
+        ``nargs='+'``, the converter applied to the remaining tokens
+    """
+    simple_commands: Dict[
+        str, Tuple[str, Tuple[Callable, ...], Optional[Callable]]
+    ] = {}
+    for command in _COMMANDS:
+        if command.keyword or any(
+            len(argument_args) != 1
+            or argument_args[0].startswith("-")
+            or set(argument_kwargs) - {"type", "nargs"}
+            for argument_args, argument_kwargs in command.arguments
+        ):
+            continue
+        # Only a trailing `nargs='+'` argument can be mapped to a token slice
+        if any(
+            argument_kwargs.get("nargs") not in (None, "+")
+            for _, argument_kwargs in command.arguments
+        ) or any(
+            "nargs" in argument_kwargs for _, argument_kwargs in command.arguments[:-1]
+        ):
+            continue
+        tail_converter: Optional[Callable] = None
+        arguments = command.arguments
+        if arguments and "nargs" in arguments[-1][1]:
+            tail_converter = arguments[-1][1].get("type", str)
+            arguments = arguments[:-1]
+        converters = tuple(
+            argument_kwargs.get("type", str) for _, argument_kwargs in arguments
         )
+        simple_commands[command.name] = (command.method, converters, tail_converter)
+    return simple_commands
+
+
+_SIMPLE_COMMANDS = _build_simple_commands()
+
+# Commands taking no arguments at all, matched against the stripped input line
+# before any tokenization: the most used status commands dispatch immediately
+_ZERO_ARGUMENT_METHODS: Dict[str, str] = {
+    name: method
+    for name, (method, converters, tail_converter) in _SIMPLE_COMMANDS.items()
+    if not converters and tail_converter is None
+}
+
+_exception_handlers: Optional[Dict[type, Callable[[BaseException], None]]] = None
+
+
+def _build_exception_handlers() -> Dict[type, Callable[[BaseException], None]]:
+    # Imported here so `import safe_cli.prompt_parser` doesn't drag in the
+    # whole web3/eth-account stack. By the time a command raises a
+    # SafeOperator exists, so these are just `sys.modules` lookups
+    from gnosis.safe.api import SafeAPIException
+
+    from .operators import SafeServiceNotAvailable
+    from .operators.exceptions import (
+        AccountNotLoadedException,
+        ExistingOwnerException,
+        FallbackHandlerNotSupportedException,
+        HardwareWalletException,
+        HashAlreadyApproved,
+        InvalidMasterCopyException,
+        InvalidMigrationContractException,
+        InvalidNonceException,
+        NonExistingOwnerException,
+        NotEnoughEtherToSend,
+        NotEnoughSignatures,
+        NotEnoughTokenToSend,
+        SafeAlreadyUpdatedException,
+        SafeOperatorException,
+        SafeVersionNotSupportedException,
+        SameFallbackHandlerException,
+        SameMasterCopyException,
+        SenderRequiredException,
+        ThresholdLimitException,
+    )
 
-    @safe_exception
-    def drain(args):
-        safe_operator.drain(args.to)
+    def api_exception(e):
+        if e.args:
+            print_formatted_text(HTML(f"<b><ansired>{e.args[0]}</ansired></b>"))
 
-    @safe_exception
-    def get_threshold(args):
-        safe_operator.get_threshold()
+    def account_not_loaded(e):
+        print_formatted_text(
+            HTML(f"<ansired>Account {e.args[0]} is not loaded</ansired>")
+        )
 
-    @safe_exception
-    def get_nonce(args):
-        safe_operator.get_nonce()
+    def not_enough_signatures(e):
+        print_formatted_text(
+            HTML(
+                f"<ansired>Cannot find enough owners to sign. {e.args[0]} missing</ansired>"
+            )
+        )
 
-    @safe_exception
-    def get_owners(args):
-        safe_operator.get_owners()
+    def sender_required(e):
+        print_formatted_text(_SENDER_REQUIRED_MESSAGE)
 
-    @safe_exception
-    def enable_module(args):
-        safe_operator.enable_module(args.address)
+    def existing_owner(e):
+        print_formatted_text(
+            HTML(
+                f"<ansired>Owner {e.args[0]} is already an owner of the Safe"
+                f"</ansired>"
+            )
+        )
 
-    @safe_exception
-    def disable_module(args):
-        safe_operator.disable_module(args.address)
+    def non_existing_owner(e):
+        print_formatted_text(
+            HTML(
+                f"<ansired>Owner {e.args[0]} is not an owner of the Safe" f"</ansired>"
+            )
+        )
 
-    @safe_exception
-    def update_version(args):
-        safe_operator.update_version()
+    def hash_already_approved(e):
+        print_formatted_text(
+            HTML(
+                f"<ansired>Transaction with safe-tx-hash {e.args[0].hex()} has already been approved by "
+                f"owner {e.args[1]}</ansired>"
+            )
+        )
 
-    @safe_exception
-    def update_version_to_l2(args):
-        safe_operator.update_version_to_l2(args.migration_contract)
+    def threshold_limit(e):
+        print_formatted_text(_THRESHOLD_LIMIT_MESSAGE)
 
-    @safe_exception
-    def get_info(args):
-        safe_operator.print_info()
+    def same_fallback_handler(e):
+        print_formatted_text(
+            HTML(f"<ansired>Fallback handler {e.args[0]} is the current one</ansired>")
+        )
 
-    @safe_exception
-    def get_refresh(args):
-        safe_operator.refresh_safe_cli_info()
+    def fallback_handler_not_supported(e):
+        print_formatted_text(_FALLBACK_HANDLER_NOT_SUPPORTED_MESSAGE)
 
-    @safe_exception
-    def get_balances(args):
-        safe_operator.get_balances()
+    def same_master_copy(e):
+        print_formatted_text(
+            HTML(f"<ansired>Master Copy {e.args[0]} is the current one</ansired>")
+        )
 
-    @safe_exception
-    def get_history(args):
-        safe_operator.get_transaction_history()
+    def invalid_master_copy(e):
+        print_formatted_text(
+            HTML(f"<ansired>Master Copy {e.args[0]} is not valid</ansired>")
+        )
 
-    @safe_exception
-    def sign_tx(args):
-        safe_operator.submit_signatures(args.safe_tx_hash)
+    def safe_already_updated(e):
+        print_formatted_text(_SAFE_ALREADY_UPDATED_MESSAGE)
 
-    @safe_exception
-    def batch_txs(args):
-        safe_operator.batch_txs(args.safe_nonce, args.safe_tx_hashes)
+    def not_enough_to_send(e):
+        print_formatted_text(
+            HTML(
+                f"<ansired>Cannot find enough to send. Current balance is {e.args[0]}"
+                f"</ansired>"
+            )
+        )
 
-    @safe_exception
-    def execute_tx(args):
-        safe_operator.execute_tx(args.safe_tx_hash)
+    def service_not_available(e):
+        print_formatted_text(
+            HTML(f"<ansired>Service not available for network {e.args[0]}</ansired>")
+        )
 
-    @safe_exception
-    def get_delegates(args):
-        safe_operator.get_delegates()
+    def hardware_wallet_error(e):
+        print_formatted_text(
+            HTML(f"<ansired>HwDevice exception: {e.args[0]}</ansired>")
+        )
 
-    @safe_exception
-    def add_delegate(args):
-        safe_operator.add_delegate(args.address, args.label, args.signer)
+    def operator_error(e):
+        print_formatted_text(HTML(f"<ansired>{e.args[0]}</ansired>"))
+
+    return {
+        SafeAPIException: api_exception,
+        AccountNotLoadedException: account_not_loaded,
+        NotEnoughSignatures: not_enough_signatures,
+        SenderRequiredException: sender_required,
+        ExistingOwnerException: existing_owner,
+        NonExistingOwnerException: non_existing_owner,
+        HashAlreadyApproved: hash_already_approved,
+        ThresholdLimitException: threshold_limit,
+        SameFallbackHandlerException: same_fallback_handler,
+        FallbackHandlerNotSupportedException: fallback_handler_not_supported,
+        SameMasterCopyException: same_master_copy,
+        InvalidMasterCopyException: invalid_master_copy,
+        InvalidMigrationContractException: operator_error,
+        InvalidNonceException: operator_error,
+        SafeAlreadyUpdatedException: safe_already_updated,
+        SafeVersionNotSupportedException: operator_error,
+        NotEnoughEtherToSend: not_enough_to_send,
+        NotEnoughTokenToSend: not_enough_to_send,
+        SafeServiceNotAvailable: service_not_available,
+        HardwareWalletException: hardware_wallet_error,
+        SafeOperatorException: operator_error,
+    }
+
+
+def _handle_safe_exception(e: BaseException) -> bool:
+    """
+    Print the error message of a known Safe exception, dispatching on the
+    exception type (walking its mro, so subclasses without a specific handler
+    fall back to their parent's one) instead of a linear `except` chain
 
-    @safe_exception
-    def remove_delegate(args):
-        safe_operator.remove_delegate(args.address, args.signer)
+    :param e:
+    :return: `True` if the exception was handled, `False` otherwise
+    """
+    global _exception_handlers
+    if _exception_handlers is None:
+        _exception_handlers = _build_exception_handlers()
+    for exception_class in type(e).__mro__:
+        handler = _exception_handlers.get(exception_class)
+        if handler is not None:
+            handler(e)
+            return True
+    return False
 
-    # Cli owners
-    parser_show_cli_owners = subparsers.add_parser("show_cli_owners")
-    parser_show_cli_owners.set_defaults(func=show_cli_owners)
 
-    parser_load_cli_owners_from_words = subparsers.add_parser(
-        "load_cli_owners_from_words"
-    )
-    parser_load_cli_owners_from_words.add_argument("words", type=str, nargs="+")
-    parser_load_cli_owners_from_words.set_defaults(func=load_cli_owners_from_words)
-
-    parser_load_cli_owners = subparsers.add_parser("load_cli_owners")
-    parser_load_cli_owners.add_argument("keys", type=str, nargs="+")
-    parser_load_cli_owners.set_defaults(func=load_cli_owners)
-
-    parser_load_ledger_cli_owners = subparsers.add_parser("load_ledger_cli_owners")
-    parser_load_ledger_cli_owners.add_argument(
-        "--derivation-path",
-        type=str,
-        help="Load address for the provided derivation path",
-    )
-    parser_load_ledger_cli_owners.add_argument(
-        "--legacy-accounts",
-        action="store_true",
-        help="Enable search legacy accounts",
-    )
-    parser_load_ledger_cli_owners.set_defaults(func=load_ledger_cli_owners)
+def safe_exception(function):
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        try:
+            return function(*args, **kwargs)
+        except Exception as e:
+            if not _handle_safe_exception(e):
+                raise
 
-    parser_unload_cli_owners = subparsers.add_parser("unload_cli_owners")
-    parser_unload_cli_owners.add_argument(
-        "addresses", type=check_ethereum_address, nargs="+"
-    )
-    parser_unload_cli_owners.set_defaults(func=unload_cli_owners)
+    return wrapper
 
-    # Change threshold
-    parser_change_threshold = subparsers.add_parser("change_threshold")
-    parser_change_threshold.add_argument("threshold", type=int)
-    parser_change_threshold.set_defaults(func=change_threshold)
 
-    # Approve hash
-    parser_approve_hash = subparsers.add_parser("approve_hash")
-    parser_approve_hash.add_argument("hash_to_approve", type=check_keccak256_hash)
-    parser_approve_hash.add_argument("sender", type=check_ethereum_address)
-    parser_approve_hash.set_defaults(func=approve_hash)
-
-    # Add owner
-    parser_add_owner = subparsers.add_parser("add_owner")
-    parser_add_owner.add_argument("address", type=check_ethereum_address)
-    parser_add_owner.add_argument("--threshold", type=int, default=None)
-    parser_add_owner.set_defaults(func=add_owner)
-
-    # Remove owner
-    parser_remove_owner = subparsers.add_parser("remove_owner")
-    parser_remove_owner.add_argument("address", type=check_ethereum_address)
-    parser_remove_owner.add_argument("--threshold", type=int, default=None)
-    parser_remove_owner.set_defaults(func=remove_owner)
-
-    # Change FallbackHandler
-    parser_change_fallback_handler = subparsers.add_parser("change_fallback_handler")
-    parser_change_fallback_handler.add_argument("address", type=check_ethereum_address)
-    parser_change_fallback_handler.set_defaults(func=change_fallback_handler)
-
-    # Change Guard
-    parser_change_guard = subparsers.add_parser("change_guard")
-    parser_change_guard.add_argument("address", type=check_ethereum_address)
-    parser_change_guard.set_defaults(func=change_guard)
-
-    # Change MasterCopy
-    parser_change_master_copy = subparsers.add_parser("change_master_copy")
-    parser_change_master_copy.add_argument("address", type=check_ethereum_address)
-    parser_change_master_copy.set_defaults(func=change_master_copy)
+@safe_exception
+def _run_command(args):
+    """
+    Generic handler for `_COMMANDS`: calls the `SafeOperator` method with the
+    argument mapping stored in the parser defaults
+    """
+    method = getattr(args._safe_operator, args._method)
+    return method(
+        *(getattr(args, attribute) for attribute in args._positional),
+        **{kwarg: getattr(args, attribute) for kwarg, attribute in args._keyword},
+    )
 
-    # Update Safe to last version
-    parser_update_version = subparsers.add_parser("update")
-    parser_update_version.set_defaults(func=update_version)
 
-    # Update non L2 Safe to L2 Safe
-    parser_update_version_to_l2 = subparsers.add_parser("update_version_to_l2")
-    parser_update_version_to_l2.add_argument(
-        "migration_contract", type=check_ethereum_address
-    )
-    parser_update_version_to_l2.set_defaults(func=update_version_to_l2)
+# Registration data resolved from `_COMMANDS` once at import, so building a
+# parser (and materializing a lazy subparser) does no per-call introspection
+# of the command table
+_COMMAND_ARGUMENTS: Dict[str, Tuple] = {
+    command.name: command.arguments for command in _COMMANDS
+}
+_COMMAND_DEFAULTS: Dict[str, Dict[str, Any]] = {
+    command.name: {
+        "func": _run_command,
+        "_method": command.method,
+        "_positional": command.positional,
+        "_keyword": command.keyword,
+    }
+    for command in _COMMANDS
+}
 
-    # Send custom/ether/erc20/erc721
-    parser_send_custom = subparsers.add_parser("send_custom")
-    parser_send_ether = subparsers.add_parser("send_ether")
-    parser_send_erc20 = subparsers.add_parser("send_erc20")
-    parser_send_erc721 = subparsers.add_parser("send_erc721")
-    parser_send_custom.set_defaults(func=send_custom)
-    parser_send_ether.set_defaults(func=send_ether)
-    parser_send_erc20.set_defaults(func=send_erc20)
-    parser_send_erc721.set_defaults(func=send_erc721)
-    # They have some common arguments
-    for parser in (
-        parser_send_custom,
-        parser_send_ether,
-        parser_send_erc20,
-        parser_send_erc721,
-    ):
-        parser.add_argument(
-            "--safe-nonce",
-            type=int,
-            help="Use custom safe nonce instead of "
-            "the one for last executed SafeTx + 1",
-        )
 
-    # To/value is common for send custom and send ether
-    for parser in (parser_send_custom, parser_send_ether):
-        parser.add_argument("to", type=check_ethereum_address)
-        parser.add_argument("value", type=int)
+@safe_exception
+def _run_simple_command(method, arguments):
+    return method(*arguments)
 
-    parser_send_custom.add_argument("data", type=check_hex_str)
-    parser_send_custom.add_argument(
-        "--delegate", action="store_true", help="Use DELEGATE_CALL. By default use CALL"
-    )
 
-    # Send erc20/721 have common arguments
-    for parser in (parser_send_erc20, parser_send_erc721):
-        parser.add_argument("to", type=check_ethereum_address)
-        parser.add_argument("token_address", type=check_ethereum_address)
+class PromptParser:
+    def __init__(self, safe_operator: "SafeOperator"):
+        self.mode_parser = argparse.ArgumentParser(prog="")
+        self.safe_operator = safe_operator
+        self.prompt_parser = build_prompt_parser(safe_operator)
 
-    parser_send_erc20.add_argument("amount", type=int)
-    parser_send_erc721.add_argument("token_id", type=int)
+    def process_command(self, command: str):
+        stripped_command = command.strip()
+        method_name = _ZERO_ARGUMENT_METHODS.get(stripped_command)
+        if method_name is not None:
+            return _run_simple_command(getattr(self.safe_operator, method_name), ())
+        tokens = command.split()
+        if tokens and not any(token.startswith("-") for token in tokens):
+            # Fast path: commands taking only fixed positional arguments are
+            # dispatched straight from the tokens, skipping the full argparse
+            # pipeline. Anything unexpected falls through to argparse, which
+            # reports the error as usual
+            simple_command = _SIMPLE_COMMANDS.get(tokens[0])
+            if simple_command is not None:
+                method_name, converters, tail_converter = simple_command
+                values = tokens[1:]
+                arity_matches = (
+                    len(values) == len(converters)
+                    if tail_converter is None
+                    else len(values) > len(converters)
+                )
+                if arity_matches:
+                    try:
+                        arguments = [
+                            converter(token)
+                            for converter, token in zip(converters, values)
+                        ]
+                        if tail_converter is not None:
+                            arguments.append(
+                                [
+                                    tail_converter(token)
+                                    for token in values[len(converters) :]
+                                ]
+                            )
+                    except (argparse.ArgumentTypeError, TypeError, ValueError):
+                        pass
+                    else:
+                        return _run_simple_command(
+                            getattr(self.safe_operator, method_name), arguments
+                        )
+        args = self.prompt_parser.parse_args(tokens)
+        return args.func(args)
 
-    # Drain only needs receiver account
-    parser_drain = subparsers.add_parser("drain")
-    parser_drain.set_defaults(func=drain)
-    parser_drain.add_argument("to", type=check_ethereum_address)
 
-    # Retrieve threshold, nonce or owners
-    parser_get_threshold = subparsers.add_parser("get_threshold")
-    parser_get_threshold.set_defaults(func=get_threshold)
+# Built parsers, one per `SafeOperator`. Weak keys so switching between
+# blockchain and tx-service operators doesn't keep dead operators alive
+_PROMPT_PARSER_CACHE: "WeakKeyDictionary[SafeOperator, argparse.ArgumentParser]" = (
+    WeakKeyDictionary()
+)
 
-    parser_get_nonce = subparsers.add_parser("get_nonce")
-    parser_get_nonce.set_defaults(func=get_nonce)
 
-    parser_get_owners = subparsers.add_parser("get_owners")
-    parser_get_owners.set_defaults(func=get_owners)
+def build_prompt_parser(safe_operator: "SafeOperator") -> argparse.ArgumentParser:
+    """
+    Returns an ArgParse capable of decoding and executing the Safe commands.
+    Parsers are cached per `safe_operator`, so building is only paid once
+    per session even if several `PromptParser` are instantiated
+    :param safe_operator:
+    :return:
+    """
+    prompt_parser = _PROMPT_PARSER_CACHE.get(safe_operator)
+    if prompt_parser is None:
+        prompt_parser = _PROMPT_PARSER_CACHE[safe_operator] = _build_prompt_parser(
+            safe_operator
+        )
+    return prompt_parser
 
-    # Enable and disable modules
-    parser_enable_module = subparsers.add_parser("enable_module")
-    parser_enable_module.add_argument("address", type=check_ethereum_address)
-    parser_enable_module.set_defaults(func=enable_module)
 
-    parser_disable_module = subparsers.add_parser("disable_module")
-    parser_disable_module.add_argument("address", type=check_ethereum_address)
-    parser_disable_module.set_defaults(func=disable_module)
+def _build_prompt_parser(safe_operator: "SafeOperator") -> argparse.ArgumentParser:
+    # The handlers reference the operator through a weak proxy: the cache maps
+    # operator -> parser, so a strong reference from the parser back to the
+    # operator would keep evicted operators alive forever
+    safe_operator = proxy(safe_operator)
+    prompt_parser = argparse.ArgumentParser(prog="")
+    prompt_parser.register("action", "parsers", _LazySubParsersAction)
+    subparsers = prompt_parser.add_subparsers()
 
-    # Info and refresh
-    parser_info = subparsers.add_parser("info")
-    parser_info.set_defaults(func=get_info)
+    for name in _COMMAND_DEFAULTS:
 
-    parser_refresh = subparsers.add_parser("refresh")
-    parser_refresh.set_defaults(func=get_refresh)
+        def builder(subparsers_action: _LazySubParsersAction, name=name) -> None:
+            parser = subparsers_action.add_parser(name)
+            for argument_args, argument_kwargs in _COMMAND_ARGUMENTS[name]:
+                parser.add_argument(*argument_args, **argument_kwargs)
+            parser.set_defaults(_safe_operator=safe_operator, **_COMMAND_DEFAULTS[name])
 
-    # Tx-Service
-    # TODO Use subcommands
-    parser_tx_service = subparsers.add_parser("balances")
-    parser_tx_service.set_defaults(func=get_balances)
-
-    parser_tx_service = subparsers.add_parser("history")
-    parser_tx_service.set_defaults(func=get_history)
-
-    parser_tx_service = subparsers.add_parser("sign-tx")
-    parser_tx_service.set_defaults(func=sign_tx)
-    parser_tx_service.add_argument("safe_tx_hash", type=check_hex_str)
-
-    parser_tx_service = subparsers.add_parser("batch-txs")
-    parser_tx_service.set_defaults(func=batch_txs)
-    parser_tx_service.add_argument("safe_nonce", type=int)
-    parser_tx_service.add_argument("safe_tx_hashes", type=check_hex_str, nargs="+")
-
-    parser_tx_service = subparsers.add_parser("execute-tx")
-    parser_tx_service.set_defaults(func=execute_tx)
-    parser_tx_service.add_argument("safe_tx_hash", type=check_hex_str)
-
-    # List delegates
-    parser_delegates = subparsers.add_parser("get_delegates")
-    parser_delegates.set_defaults(func=get_delegates)
-
-    # Add delegate
-    parser_add_delegate = subparsers.add_parser("add_delegate")
-    parser_add_delegate.set_defaults(func=add_delegate)
-    parser_add_delegate.add_argument("address", type=check_ethereum_address)
-    parser_add_delegate.add_argument("label", type=str)
-    parser_add_delegate.add_argument("signer", type=check_ethereum_address)
-
-    # Remove delegate
-    parser_remove_delegate = subparsers.add_parser("remove_delegate")
-    parser_remove_delegate.set_defaults(func=remove_delegate)
-    parser_remove_delegate.add_argument("address", type=check_ethereum_address)
-    parser_remove_delegate.add_argument("signer", type=check_ethereum_address)
+        subparsers.add_lazy_parser(name, builder)
 
     return prompt_parser
@@ -33,6 +33,12 @@ class TestArgparseValidators(SafeCliTestCaseMixin, unittest.TestCase):
         with self.assertRaises(argparse.ArgumentTypeError):
             check_ethereum_address(not_valid_address)
 
+        lowercase_address = address.lower()
+        with self.assertRaisesRegex(
+            argparse.ArgumentTypeError, "has no EIP-55 checksum"
+        ):
+            check_ethereum_address(lowercase_address)
+
     def test_check_private_key(self):
         account = Account.create()
         self.assertEqual(check_private_key(account.key.hex()), account.key.hex())